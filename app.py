@@ -21,6 +21,7 @@ from flask_sqlalchemy import SQLAlchemy
 from werkzeug.security import generate_password_hash, check_password_hash
 from ultralytics import YOLO
 from collections import defaultdict
+from sprites import SpriteSheetWriter
 
 # ── 설정 ─────────────────────────────────────────────────────
 logging.basicConfig(
@@ -35,9 +36,13 @@ BASE_DIR      = os.path.dirname(os.path.abspath(__file__))
 UPLOAD_FOLDER = os.path.join(BASE_DIR, 'static', 'uploads')
 FRAME_FOLDER  = os.path.join(BASE_DIR, 'static', 'frames')
 DETECT_FOLDER = os.path.join(BASE_DIR, 'static', 'detections')
+THUMB_FOLDER  = os.path.join(BASE_DIR, 'thumbnails')  # static 밖 → 로그인 라우트로만 접근
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(FRAME_FOLDER,  exist_ok=True)
 os.makedirs(DETECT_FOLDER, exist_ok=True)
+os.makedirs(THUMB_FOLDER,  exist_ok=True)
+
+THUMB_MAX_AGE = 365 * 24 * 3600  # 스프라이트 경로에 실행별 토큰 포함 → 1년 캐시
 
 # ── YOLO 모델 로드 ───────────────────────────────────────────
 model = YOLO('/home/sjy/0528_waterdeer_yolo11m/0528_waterdeer_yolo11m8/weights/0528_waterdeer_11m.pt')
@@ -140,10 +145,12 @@ def convert_sec_to_mp4_ffmpeg(sec_path, mp4_path):
 # ──────────────────────────────────────────────────────────
 # NEW ─ 간이 검출: 시각 리스트만 반환 (CSV/JSON 생성 X)
 # ──────────────────────────────────────────────────────────
-def detect_times_preview(frames_folder: str, fps: float, offset_sec: float = 0) -> list[int]:
+def detect_times_preview(frames_folder: str, fps: float, offset_sec: float = 0,
+                         sprite: SpriteSheetWriter | None = None) -> list[int]:
     """
     YOLO로 프레임을 훑어본 뒤, '검출된 초 단위 시각'만 리스트로 반환한다.
     - CSV/JSON/클립을 생성하지 않는다.
+    - sprite 가 주어지면 읽은 프레임을 미리보기 타일로 함께 넘긴다 (영상 절대 초 기준).
     """
     secs = set()
     files = sorted(
@@ -158,6 +165,8 @@ def detect_times_preview(frames_folder: str, fps: float, offset_sec: float = 0)
         frame = cv2.imread(os.path.join(frames_folder, fname))
         if frame is None:
             continue
+        if sprite is not None:
+            sprite.add(int(idx / fps), frame)   # 플레이어와 같은 영상 절대 초
         dets = model(frame)[0].boxes.data.cpu().numpy()
         for *_, conf, cid in dets:
             if conf > 0.4:                 # 기존 임계값과 동일
@@ -494,14 +503,21 @@ def extract_frames_api():
     current_user.progress = 60
     db.session.commit()
 
-    # ② “임시” 검출: 시각 배열만 반환
-    detected_times = detect_times_preview(out_dir, fps, offset)
+    # ② “임시” 검출: 시각 배열만 반환 (+ 미리보기 스프라이트 시트 생성)
+    sprite = SpriteSheetWriter(os.path.join(THUMB_FOLDER, name))
+    try:
+        detected_times = detect_times_preview(out_dir, fps, offset, sprite)
+        thumb_index    = sprite.close()
+    except Exception:
+        sprite.discard()
+        raise
 
     current_user.progress = 100
     db.session.commit()
 
     return jsonify({
-        'detected_times': detected_times    # 타임라인용 데이터만 전달
+        'detected_times': detected_times,   # 타임라인용 데이터만 전달
+        'thumbnails'    : url_for('thumbnail_file', name=name, filename=thumb_index)
     })
 
 
@@ -587,6 +603,29 @@ def download_json(filename):
     path = os.path.join(DETECT_FOLDER, safe)
     return send_file(path, as_attachment=True, download_name=safe)
 
+@app.route('/thumbnails/<name>/<path:filename>')
+@login_required
+def thumbnail_file(name, filename):
+    """
+    스프라이트 시트/인덱스 전송 (filename = '<token>/<파일>')
+    - 본인이 업로드한 영상(파일명 stem == name)만 허용, 아니면 404
+    - 경로가 실행마다 바뀌므로 immutable 장기 캐시
+    - CCTV 영상이므로 공유 캐시(프록시/CDN)에는 저장 금지 → private
+    """
+    owned = any(
+        os.path.splitext(v.filename)[0] == name
+        for v in Video.query.filter_by(user_id=current_user.id).all()
+    )
+    if not owned:
+        return jsonify({'error': '파일 없음'}), 404
+
+    folder = os.path.join(THUMB_FOLDER, os.path.basename(name))
+    resp = send_from_directory(folder, filename, max_age=THUMB_MAX_AGE)
+    resp.cache_control.public    = False
+    resp.cache_control.private   = True
+    resp.cache_control.immutable = True
+    return resp
+
 @app.route('/download_clip')
 def download_clip():
     vf    = request.args.get('video_file')
@@ -0,0 +1,112 @@
+# sprites.py
+import os
+import cv2
+import json
+import time
+import uuid
+import shutil
+import numpy as np
+from math import ceil
+
+
+# ──────────────────────────────────────────────────────────
+# 타임라인 미리보기용 스프라이트 시트
+# ──────────────────────────────────────────────────────────
+class SpriteSheetWriter:
+    """
+    검출 단계에서 이미 읽어 둔 프레임을 저해상도 타일로 줄여 스프라이트 시트로 묶는다.
+    - 추가 디코딩 없음: detect_times_preview 가 넘겨주는 frame 을 그대로 사용
+    - 시트 한 장(cols × rows)이 차면 바로 기록 → 긴 영상에서도 메모리 일정
+    - 실행 중에는 video_dir/<token>.tmp/ 에 쓰고 close() 에서 <token>/ 으로 rename
+      → 완료된 실행만 <token>/ 으로 보이고, 장기 캐시(immutable)와 충돌 없음
+    - token = 시작 시각(ns, 16자리 hex) + 난수 → 이름 순서 = 실행 순서, 동률 없음
+    - 정리 규칙 (close() 시)
+        · <token>.tmp/ 가 stale_sec 이상 갱신되지 않음 → 죽은 워커의 잔여물로 보고 삭제
+          (시트 100장마다 기록되므로 정상 실행이면 mtime 이 계속 갱신됨)
+        · 더 오래된 완료 실행은 grace_sec 이 지난 뒤에만 삭제
+          → 이전 인덱스를 보고 있는 페이지가 시트 404 를 맞지 않게 함
+    """
+    INDEX_NAME = 'index.json'
+    TMP_SUFFIX = '.tmp'
+
+    def __init__(self, video_dir, tile_w=160, cols=10, rows=10,
+                 stale_sec=1200, grace_sec=24 * 3600):
+        self.video_dir = video_dir
+        self.token     = f"{time.time_ns():016x}-{uuid.uuid4().hex[:6]}"
+        self.tmp_dir   = os.path.join(video_dir, self.token + self.TMP_SUFFIX)
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        self.tile_w    = tile_w
+        self.tile_h    = None        # 첫 프레임 비율로 결정
+        self.cols      = cols
+        self.rows      = rows
+        self.stale_sec = stale_sec
+        self.grace_sec = grace_sec
+        self.sheets    = []          # 기록된 시트 파일명
+        self.tiles     = {}          # "초" → [시트 번호, x, y]
+        self.buf       = []          # 현재 시트에 들어갈 타일
+
+    def add(self, sec, frame):
+        key = str(sec)
+        if key in self.tiles:        # 초당 타일 1장
+            return
+        if self.tile_h is None:
+            h, w = frame.shape[:2]
+            self.tile_h = max(1, round(self.tile_w * h / w))
+        tile = cv2.resize(frame, (self.tile_w, self.tile_h), interpolation=cv2.INTER_AREA)
+        r, c = divmod(len(self.buf), self.cols)
+        self.tiles[key] = [len(self.sheets), c * self.tile_w, r * self.tile_h]
+        self.buf.append(tile)
+        if len(self.buf) == self.cols * self.rows:
+            self._flush()
+
+    def _flush(self):
+        if not self.buf:
+            return
+        used_rows = ceil(len(self.buf) / self.cols)
+        sheet = np.zeros(
+            (used_rows * self.tile_h, self.cols * self.tile_w, 3), dtype=np.uint8
+        )
+        for i, tile in enumerate(self.buf):
+            r, c = divmod(i, self.cols)
+            y, x = r * self.tile_h, c * self.tile_w
+            sheet[y:y + self.tile_h, x:x + self.tile_w] = tile
+        fname = f"{len(self.sheets)}.jpg"
+        cv2.imwrite(os.path.join(self.tmp_dir, fname), sheet,
+                    [cv2.IMWRITE_JPEG_QUALITY, 70])
+        self.sheets.append(fname)
+        self.buf = []
+
+    def close(self):
+        """인덱스 기록 → <token>/ 으로 공개 → 이전 실행 정리, '<token>/index.json' 반환"""
+        self._flush()
+        with open(os.path.join(self.tmp_dir, self.INDEX_NAME), 'w', encoding='utf-8') as f:
+            json.dump({
+                'tile_width' : self.tile_w,
+                'tile_height': self.tile_h or 0,
+                'sheets'     : self.sheets,
+                'tiles'      : self.tiles
+            }, f)
+        os.rename(self.tmp_dir, os.path.join(self.video_dir, self.token))
+        self._cleanup()
+        return f"{self.token}/{self.INDEX_NAME}"
+
+    def discard(self):
+        """실패한 실행의 시트 삭제 (인덱스 없는 고아 디렉터리 방지)"""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _cleanup(self):
+        now = time.time()
+        for entry in os.listdir(self.video_dir):
+            path = os.path.join(self.video_dir, entry)
+            try:
+                if entry.endswith(self.TMP_SUFFIX):
+                    # 진행 중인 다른 실행은 mtime 이 계속 갱신되므로 건드리지 않음
+                    if now - os.path.getmtime(path) > self.stale_sec:
+                        shutil.rmtree(path, ignore_errors=True)
+                elif entry < self.token:
+                    index_p = os.path.join(path, self.INDEX_NAME)
+                    done_at = os.path.getmtime(index_p if os.path.exists(index_p) else path)
+                    if now - done_at > self.grace_sec:
+                        shutil.rmtree(path, ignore_errors=True)
+            except FileNotFoundError:
+                continue             # 다른 요청이 먼저 정리함
@@ -2,6 +2,10 @@ let currentVideoFile = '';
 let timelineRanges = [];     // [{ start:Number, end:Number }]
 let videoDuration  = 0;
 let dragging       = null;   // { dot, idx, edge, startX, origLeftPx }
+let thumbIndex     = null;   // { tile_width, tile_height, sheets:[url], tiles:{ sec:[sheet,x,y] } }
+let thumbIndexUrl  = null;   // 마지막으로 요청한 인덱스 URL (지연 응답 무시용)
+let thumbSheets    = {};     // 시트 번호 → { ok: null(로딩 중) | true | false }
+let lastPreviewEvent = null; // 시트 로드 완료 시 다시 그릴 마지막 호버 위치
 
 /** HH:MM:SS → 초 변환 */
 function hms2sec(hms) {
@@ -195,6 +199,12 @@ window.addEventListener('DOMContentLoaded', () => {
     });
   }
 
+  // 7-1) 타임라인 호버 미리보기
+  if (wrapper) {
+    wrapper.addEventListener('mousemove', showTimelinePreview);
+    wrapper.addEventListener('mouseleave', hideTimelinePreview);
+  }
+
   // 8) 프로그레스바 드래그 탐색
   const progDrag = document.getElementById('timelineProgress');
   let isDragging = false;
@@ -402,9 +412,10 @@ async function extractAndDetect(fn) {
     method:'POST',
     body:new URLSearchParams({ video_file:fn, start_time:st })
   });
-  const { detected_times } = await res.json();
+  const { detected_times, thumbnails } = await res.json();
 
   currentVideoFile = fn;
+  loadThumbnailIndex(thumbnails);
   const player = document.getElementById('videoPlayer');
   player.src = `/static/uploads/${encodeURIComponent(fn.replace(/\.(sec|avi)$/i,'.mp4'))}`;
   player.load();
@@ -439,6 +450,90 @@ async function extractAndDetect(fn) {
 
 
 
+/** 스프라이트 인덱스 로드 (시트는 호버 위치 주변만 미리 받음) */
+async function loadThumbnailIndex(url) {
+  thumbIndex    = null;
+  thumbIndexUrl = url;
+  thumbSheets   = {};
+  if (!url) return;
+  try {
+    const res = await fetch(url, { credentials: 'same-origin' });
+    const idx = await res.json();
+    if (thumbIndexUrl !== url) return;   // 그 사이 다른 영상 선택됨 → 폐기
+    idx.sheets = idx.sheets.map(name => new URL(name, new URL(url, location.href)).href);
+    thumbIndex = idx;
+    loadThumbSheet(0);
+  } catch (err) {
+    console.error(err);
+  }
+}
+
+/** 시트 한 장 로드 (중복 요청 없음), 완료 시 보고 있던 위치 다시 그리기 */
+function loadThumbSheet(i) {
+  if (!thumbIndex || i < 0 || i >= thumbIndex.sheets.length) return null;
+  if (!thumbSheets[i]) {
+    const entry = { ok: null };
+    const img   = new Image();
+    const sheets = thumbSheets;
+    img.onload  = () => {
+      entry.ok = true;
+      if (sheets === thumbSheets && lastPreviewEvent) showTimelinePreview(lastPreviewEvent);
+    };
+    img.onerror = () => {
+      entry.ok = false;
+      if (sheets === thumbSheets && lastPreviewEvent) showTimelinePreview(lastPreviewEvent);
+    };
+    img.src = thumbIndex.sheets[i];
+    thumbSheets[i] = entry;
+  }
+  return thumbSheets[i];
+}
+
+/** sec 이하에서 가장 가까운 타일 */
+function findThumbTile(sec) {
+  for (let t = Math.floor(sec); t >= 0; t--) {
+    const tile = thumbIndex.tiles[t];
+    if (tile) return tile;
+  }
+  return null;
+}
+
+function showTimelinePreview(e) {
+  lastPreviewEvent = e;
+  const preview = document.getElementById('timelinePreview');
+  if (!preview || !thumbIndex || !videoDuration) return;
+  const wrapper = document.getElementById('timelineWrapper');
+  const r   = wrapper.getBoundingClientRect();
+  const sec = Math.max(0, (e.clientX - r.left) / r.width * videoDuration);
+  const tile = findThumbTile(sec);
+  if (!tile) return hideTimelinePreview();
+
+  const [sheet, x, y] = tile;
+  const entry = loadThumbSheet(sheet);
+  loadThumbSheet(sheet - 1);            // 앞뒤 시트 미리 받기
+  loadThumbSheet(sheet + 1);
+  if (!entry || entry.ok !== true) {    // 로딩 중이거나 실패(404 등)
+    preview.classList.add('d-none');
+    return;
+  }
+
+  const img = preview.querySelector('.timeline-preview-img');
+  img.style.width              = `${thumbIndex.tile_width}px`;
+  img.style.height             = `${thumbIndex.tile_height}px`;
+  img.style.backgroundImage    = `url("${thumbIndex.sheets[sheet]}")`;
+  img.style.backgroundPosition = `-${x}px -${y}px`;
+  preview.querySelector('.timeline-preview-label').textContent = formatLabel(sec);
+  preview.style.left = `${e.clientX}px`;
+  preview.style.top  = `${r.top - 4}px`;
+  preview.classList.remove('d-none');
+}
+
+function hideTimelinePreview() {
+  lastPreviewEvent = null;
+  const preview = document.getElementById('timelinePreview');
+  if (preview) preview.classList.add('d-none');
+}
+
 async function finalizeSegments() {
   const res = await fetch('/finalize_segments', {
     method: 'POST',
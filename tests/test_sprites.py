@@ -0,0 +1,108 @@
+import os
+import json
+import time
+
+import pytest
+
+np  = pytest.importorskip('numpy')
+cv2 = pytest.importorskip('cv2')
+
+from sprites import SpriteSheetWriter
+
+
+def frame(value, h=720, w=1280):
+    return np.full((h, w, 3), value, dtype=np.uint8)
+
+
+def write_run(video_dir, secs, **kw):
+    w = SpriteSheetWriter(str(video_dir), **kw)
+    for sec in secs:
+        w.add(sec, frame(sec % 256))
+    return w, w.close()
+
+
+def test_sheets_and_tile_coordinates(tmp_path):
+    w, index_rel = write_run(tmp_path, range(250))
+
+    assert index_rel == f"{w.token}/index.json"
+    run_dir = tmp_path / w.token
+    with open(run_dir / 'index.json', encoding='utf-8') as f:
+        index = json.load(f)
+
+    assert index['tile_width'] == 160
+    assert index['tile_height'] == 90
+    assert index['sheets'] == ['0.jpg', '1.jpg', '2.jpg']
+    assert len(index['tiles']) == 250
+
+    # 100 타일 경계
+    assert index['tiles']['0']   == [0, 0, 0]
+    assert index['tiles']['99']  == [0, 9 * 160, 9 * 90]
+    assert index['tiles']['100'] == [1, 0, 0]
+    assert index['tiles']['249'] == [2, 9 * 160, 4 * 90]
+
+    full = cv2.imread(str(run_dir / '0.jpg'))
+    last = cv2.imread(str(run_dir / '2.jpg'))
+    assert full.shape == (10 * 90, 10 * 160, 3)
+    assert last.shape == (5 * 90, 10 * 160, 3)   # 마지막 시트는 채워진 행만
+
+
+def test_one_tile_per_second(tmp_path):
+    w = SpriteSheetWriter(str(tmp_path))
+    w.add(3, frame(10))
+    w.add(3, frame(200))
+    w.add(4, frame(30))
+    w.close()
+
+    assert w.tiles == {'3': [0, 0, 0], '4': [0, 160, 0]}
+    sheet = cv2.imread(str(tmp_path / w.token / '0.jpg'))
+    assert abs(int(sheet[45, 80, 0]) - 10) <= 2   # 첫 프레임 유지
+
+
+def test_tmp_dir_renamed_on_close_and_removed_on_discard(tmp_path):
+    w = SpriteSheetWriter(str(tmp_path))
+    w.add(0, frame(0))
+    assert os.listdir(tmp_path) == [w.token + '.tmp']
+    w.close()
+    assert os.listdir(tmp_path) == [w.token]
+
+    failed = SpriteSheetWriter(str(tmp_path))
+    failed.add(0, frame(0))
+    failed.discard()
+    assert os.listdir(tmp_path) == [w.token]
+
+
+def test_tokens_sort_in_run_order(tmp_path):
+    a = SpriteSheetWriter(str(tmp_path))
+    b = SpriteSheetWriter(str(tmp_path))
+    assert a.token < b.token
+
+
+def test_cleanup_keeps_recent_runs_and_removes_stale(tmp_path):
+    old_at = time.time() - 7200
+
+    stale_tmp = SpriteSheetWriter(str(tmp_path))          # 죽은 워커
+    stale_tmp.add(0, frame(0))
+    stale_tmp._flush()
+    os.utime(stale_tmp.tmp_dir, (old_at, old_at))
+    live_tmp = SpriteSheetWriter(str(tmp_path))           # 진행 중인 실행
+
+    old_done, _ = write_run(tmp_path, [0])
+    os.utime(tmp_path / old_done.token / 'index.json', (old_at, old_at))
+    recent_done, _ = write_run(tmp_path, [0])
+
+    new, _ = write_run(tmp_path, [0], stale_sec=3600, grace_sec=3600)
+
+    assert sorted(os.listdir(tmp_path)) == sorted([
+        live_tmp.token + '.tmp', recent_done.token, new.token
+    ])
+
+
+def test_cleanup_never_removes_newer_run(tmp_path):
+    first  = SpriteSheetWriter(str(tmp_path), grace_sec=0)
+    second = SpriteSheetWriter(str(tmp_path), grace_sec=0)
+    second.add(0, frame(0))
+    second.close()
+    first.add(0, frame(0))
+    first.close()                                          # 늦게 끝난 이전 실행
+
+    assert sorted(os.listdir(tmp_path)) == sorted([first.token, second.token])